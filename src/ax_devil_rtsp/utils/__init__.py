@@ -1,67 +1,293 @@
-import xml.etree.ElementTree as ET
+import functools
 import re
-from typing import Dict, Any
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 import urllib.parse
+from collections.abc import Mapping
+from xml.parsers import expat
 
 from .logging import get_logger
 
+try:
+    # lxml's C-backed parser is considerably faster; fall back to driving the
+    # stdlib expat parser directly when it is not installed.
+    from lxml import etree as ET  # type: ignore
+    _HAS_LXML = True
+    _XML_PARSE_ERRORS: Tuple[type, ...] = (ET.ParseError, expat.ExpatError)
+except ImportError:
+    ET = None
+    _HAS_LXML = False
+    _XML_PARSE_ERRORS = (expat.ExpatError,)
+
 logger = get_logger(__name__)
 
+# lxml parser options. recover stays off so broken documents are rejected the
+# same way the expat fallback rejects them. Camera-supplied XML never needs
+# entity expansion, network access or xml:id tracking, so those are switched
+# off.
+_LXML_PARSER_OPTIONS = {
+    "huge_tree": False,
+    "resolve_entities": False,
+    "no_network": True,
+    "collect_ids": False,
+}
+
+# Fully qualified ONVIF tags; matching on these avoids ElementPath lookups
+_ONVIF_NS = "{http://www.onvif.org/ver10/schema}"
+_FRAME_TAG = _ONVIF_NS + "Frame"
+_OBJECT_TAG = _ONVIF_NS + "Object"
+_TYPE_TAG = _ONVIF_NS + "Type"
+
+
+# lxml parsers reset on close() and can be reused, but are not thread-safe
+_parser_local = threading.local()
+
+# expat reports namespaced names as "uri}local" with namespace_separator="}"
+_EXPAT_FRAME = _FRAME_TAG[1:]
+_EXPAT_OBJECT = _OBJECT_TAG[1:]
+_EXPAT_TYPE = _TYPE_TAG[1:]
+
+
+_DETECTED_OBJECT_KEYS = ("id", "type")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DetectedObject(Mapping):
+    """
+    A detected object from a scene metadata frame.
+
+    Objects used to be plain {'id': ..., 'type': ...} dicts, so this is also a
+    read-only Mapping over those two keys: obj['type'], obj.get('type'),
+    'type' in obj, dict(obj) and comparison with such a dict all still work.
+    It is not a dict, though; use to_dict() before e.g. json.dumps().
+    """
+
+    id: Optional[str]
+    type: Optional[str]
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        if key not in _DETECTED_OBJECT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(_DETECTED_OBJECT_KEYS)
+
+    def __len__(self) -> int:
+        return len(_DETECTED_OBJECT_KEYS)
+
+    # Mapping supplies __eq__ (equal to any mapping with the same items);
+    # it disables hashing, which the frozen dataclass provided before
+    def __hash__(self) -> int:
+        return hash((self.id, self.type))
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Return the object as a plain {'id': ..., 'type': ...} dict."""
+        return {"id": self.id, "type": self.type}
+
 
-def parse_axis_scene_metadata_xml(xml_data: bytes) -> dict:
+def _intern_type(type_text: Optional[str]) -> Optional[str]:
+    # Types come from a small vocabulary ("Human", "Vehicle", ...); interning
+    # shares one string per type across frames. IDs are unbounded and
+    # deliberately left alone.
+    return sys.intern(type_text) if type_text is not None else None
+
+
+def _get_scene_parser():
+    """Return this thread's lxml pull parser, creating it on first use."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        # lxml only reports events for the tags we ask for
+        parser = ET.XMLPullParser(
+            events=("start", "end"), tag=(_FRAME_TAG, _OBJECT_TAG, _TYPE_TAG),
+            **_LXML_PARSER_OPTIONS)
+        _parser_local.parser = parser
+    return parser
+
+
+# Placeholder for an object whose Type has not been seen (None is a valid type)
+_NO_TYPE = object()
+
+
+class _SceneCollector:
+    """
+    Backend-independent scene state fed by the lxml and expat readers.
+
+    Objects are listed in document order of their start tags, and each takes
+    the text of the first Type below it, including Types inside nested
+    Objects. Objects without a Type are skipped.
+    """
+
+    __slots__ = ("utc_time", "_entries", "_open")
+
+    def __init__(self) -> None:
+        self.utc_time: Optional[str] = None
+        self._entries: list = []  # [object_id, type_text] per Object
+        self._open: list = []     # entries of the currently open Objects
+
+    def frame(self, utc_time: Optional[str]) -> None:
+        if self.utc_time is None:
+            self.utc_time = utc_time or None
+
+    def start_object(self, object_id: Optional[str]) -> None:
+        entry = [object_id, _NO_TYPE]
+        self._entries.append(entry)
+        self._open.append(entry)
+
+    def end_object(self) -> None:
+        self._open.pop()
+
+    def type_text(self, text: Optional[str]) -> None:
+        for entry in self._open:
+            if entry[1] is _NO_TYPE:
+                entry[1] = text
+
+    def objects(self) -> list:
+        return [DetectedObject(object_id, _intern_type(type_text))
+                for object_id, type_text in self._entries if type_text is not _NO_TYPE]
+
+
+def _read_scene_lxml(xml_data: bytes) -> _SceneCollector:
+    """Collect the scene from xml_data with lxml pull events, releasing each object."""
+    parser = _get_scene_parser()
+    try:
+        parser.feed(xml_data)
+        parser.close()
+    except ET.ParseError:
+        # Don't hand a parser with undrained events to the next call
+        _parser_local.parser = None
+        raise
+
+    scene = _SceneCollector()
+    for event, elem in parser.read_events():
+        tag = elem.tag
+        if event == "start":
+            # Attributes are complete on the start event
+            if tag == _FRAME_TAG:
+                scene.frame(elem.get('UtcTime'))
+            elif tag == _OBJECT_TAG:
+                scene.start_object(elem.get('ObjectId'))
+        elif tag == _TYPE_TAG:
+            scene.type_text(elem.text)
+        elif tag == _OBJECT_TAG:
+            scene.end_object()
+            # Every Type below this object has been read; release it and the
+            # already processed siblings from the partial tree
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    return scene
+
+
+def _read_scene_expat(xml_data: bytes) -> _SceneCollector:
+    """
+    Collect the scene from xml_data with expat callbacks; no element tree is built.
+
+    Ill-formed input stops expat at the first bad byte with an ExpatError.
+    """
+    scene = _SceneCollector()
+    depth = 0
+    type_depth = None    # depth of the Type element whose text is being read
+    type_chunks = None
+    type_text_done = False  # like Element.text, stop at the Type's first child
+
+    def start(name, attrs):
+        nonlocal depth, type_depth, type_chunks, type_text_done
+        depth += 1
+        if type_depth is not None:
+            type_text_done = True
+        elif name == _EXPAT_TYPE:
+            type_depth = depth
+            type_chunks = []
+            type_text_done = False
+        if name == _EXPAT_FRAME:
+            scene.frame(attrs.get('UtcTime'))
+        elif name == _EXPAT_OBJECT:
+            scene.start_object(attrs.get('ObjectId'))
+
+    def end(name):
+        nonlocal depth, type_depth
+        if depth == type_depth:
+            scene.type_text("".join(type_chunks) or None)
+            type_depth = None
+        if name == _EXPAT_OBJECT:
+            scene.end_object()
+        depth -= 1
+
+    def text(data):
+        if depth == type_depth and not type_text_done:
+            type_chunks.append(data)
+
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text
+    parser.Parse(xml_data, True)
+    return scene
+
+
+def parse_axis_scene_metadata_xml(xml_data: bytes, as_array: bool = False) -> dict:
     """
     Parse ONVIF Scene metadata XML and extract relevant information.
 
+    The document is walked as a stream of events; each object is read and
+    released without keeping the full tree. lxml is used when installed,
+    otherwise the stdlib expat parser; both give the same result.
+
     Args:
         xml_data: Raw XML bytes data
+        as_array: Also return the objects as a NumPy structured array under
+            'objects_array' (fields 'id' and 'type', see _OBJECTS_DTYPE) for
+            vectorised filtering, e.g. arr[arr["type"] == "Human"]
 
     Returns:
-        dict: Parsed Scene metadata information
+        dict: Parsed Scene metadata information with keys 'objects'
+        (list of DetectedObject), 'utc_time' and 'raw_xml'. 'raw_xml' is the
+        xml_data bytes object itself (not a decoded copy); decode it if text
+        is needed.
     """
+    result: Dict[str, Any] = {
+        'objects': [],
+        'utc_time': None,
+        'raw_xml': xml_data
+    }
+
+    read_scene = _read_scene_lxml if _HAS_LXML else _read_scene_expat
     try:
         try:
-            xml_text = xml_data.decode('utf-8')
-        except UnicodeDecodeError:
-            xml_text = xml_data.decode('utf-8', errors='ignore')
-
-        root = ET.fromstring(xml_text)
-        result: Dict[str, Any] = {
-            'objects': [],
-            'utc_time': None,
-            'raw_xml': xml_text
-        }
-
-        ns = {
-            "tt": "http://www.onvif.org/ver10/schema",
-            "bd": "http://www.onvif.org/ver20/analytics/humanbody"
-        }
-
-        # Extract objects
-        for obj in root.findall('.//tt:Object', ns):
-            obj_id = obj.get('ObjectId')
-            type_elem = obj.find('.//tt:Type', ns)
-            if type_elem is not None:
-                result['objects'].append({
-                    'id': obj_id,
-                    'type': type_elem.text
-                })
-
-        # Extract frame time
-        for frame in root.findall('.//tt:Frame', ns):
-            utc_time = frame.get('UtcTime')
-            if utc_time:
-                result['utc_time'] = utc_time
-                break
-
-        return result
-
-    except ET.ParseError as e:
+            scene = read_scene(xml_data)
+        except _XML_PARSE_ERRORS:
+            # Drop invalid UTF-8 bytes and try once more; anything else that is
+            # broken fails again with the same bytes, so don't reparse it
+            cleaned = xml_data.decode('utf-8', errors='ignore').encode('utf-8')
+            if cleaned == xml_data:
+                raise
+            scene = read_scene(cleaned)
+        result['objects'] = scene.objects()
+        result['utc_time'] = scene.utc_time
+
+    except _XML_PARSE_ERRORS as e:
         logger.error("XML Parse Error: %s", e)
-        return {
-            'objects': [],
-            'utc_time': None,
-            'raw_xml': xml_text
-        }
+
+    if as_array:
+        result['objects_array'] = _objects_to_array(result['objects'])
+    return result
+
+
+# Fixed-width strings; ObjectId is not guaranteed to be numeric and longer
+# values are truncated to 32 characters
+_OBJECTS_DTYPE = [("id", "U32"), ("type", "U32")]
+
+
+def _objects_to_array(objects: list):
+    """Pack DetectedObjects into a NumPy structured array (None becomes '')."""
+    import numpy as np
+
+    return np.array(
+        [(obj.id or "", obj.type or "") for obj in objects], dtype=_OBJECTS_DTYPE)
 
 
 def _parse_caps_string(caps_str: str) -> Dict[str, Any]:
@@ -70,30 +296,53 @@ def _parse_caps_string(caps_str: str) -> Dict[str, Any]:
       "video/x-raw,format=(string)RGB,width=(int)640,framerate=(fraction)30/1"
     into a dict: {"format": "RGB", "width": 640, "framerate": "30/1", ...}.
     Respects GStreamer’s escape for commas (\\,).
+
+    Results are cached per caps string; a fresh dict is returned on every
+    call so callers may modify it freely.
     """
-    # Split on commas not preceded by a backslash
-    # negative lookbehind :contentReference[oaicite:1]{index=1}
-    parts = re.split(r'(?<!\\),\s*', caps_str)
-    result: Dict[str, Any] = {}
-    for part in parts:
-        # Match key=(type)value
-        m = re.match(r'([^=]+)=\(([^)]+)\)(.*)', part)
-        if not m:
-            continue
-        key, type_, raw_val = m.groups()
-        # Unescape any '\,' back to ','
-        val = raw_val.strip().strip('"').replace(r'\,', ',')
-        # Convert to native type
-        if type_ in ("int", "uint", "guint", "gint"):
-            result[key] = int(val)
-        elif type_ in ("double", "float"):
-            result[key] = float(val)
-        elif type_ == "boolean":
-            result[key] = val.lower() == "true"
-        else:
-            # string, fraction, guint64, etc. kept as string
-            result[key] = val
-    return result
+    return dict(_parse_caps_items(caps_str))
+
+
+# One "key=(type)value" field per match. A field starts the string or follows
+# a comma not preceded by a backslash; the value runs to the next such comma.
+_CAPS_FIELD_RE = re.compile(r'(?:^|(?<!\\),)\s*([^=,]+)=\(([^)]+)\)((?:[^,\\]|\\.)*)')
+
+
+def _caps_bool(val: str) -> bool:
+    return val.lower() == "true"
+
+
+# Native conversion per caps type; string, fraction, guint64, etc. are kept
+# as strings
+_CAPS_COERCE = {
+    "int": int,
+    "uint": int,
+    "guint": int,
+    "gint": int,
+    "double": float,
+    "float": float,
+    "boolean": _caps_bool,
+}
+
+
+def _coerce_caps_value(type_: str, raw_val: str) -> Any:
+    # Unescape any '\,' back to ','
+    val = raw_val.strip().strip('"').replace(r'\,', ',')
+    coerce = _CAPS_COERCE.get(type_)
+    return coerce(val) if coerce is not None else val
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_caps_items(caps_str: str) -> Tuple[Tuple[str, Any], ...]:
+    """Cached worker for _parse_caps_string, returning immutable (key, value) pairs."""
+    result = {
+        key: _coerce_caps_value(type_, raw_val)
+        for key, type_, raw_val in _CAPS_FIELD_RE.findall(caps_str)
+    }
+    return tuple(result.items())
+
+
+_SESSION_FIELDS = frozenset(("stream_name", "caps", "structure"))
 
 
 def parse_session_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -113,6 +362,18 @@ def parse_session_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
       - structure_parsed (Dict[str,Any])
       - sdes (if present, copied through)
     """
+    # Fast path for the exact shape produced by the pad-added callback
+    if raw.keys() == _SESSION_FIELDS:
+        caps, structure = raw["caps"], raw["structure"]
+        if isinstance(caps, str) and isinstance(structure, str):
+            return {
+                "stream_name": raw["stream_name"],
+                "caps": caps,
+                "caps_parsed": _parse_caps_string(caps),
+                "structure": structure,
+                "structure_parsed": _parse_caps_string(structure),
+            }
+
     parsed: Dict[str, Any] = {}
     # Copy over the simple field
     parsed["stream_name"] = raw.get("stream_name")
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from ax_devil_rtsp.utils import build_axis_rtsp_url
+# Imports GStreamer; kept out of the top-level conftest so unit test runs
+# don't need gi
+from enhanced_rtsp_server import dual_stream_rtsp_server
+
+
+@pytest.fixture(scope="session")
+def rtsp_credentials():
+    """Provide RTSP credentials from environment or default test values."""
+    return {
+        'username': os.getenv('AX_DEVIL_TARGET_USER', 'root'),
+        'password': os.getenv('AX_DEVIL_TARGET_PASS', 'fusion'),
+        'ip': os.getenv('AX_DEVIL_TARGET_ADDR', '192.168.1.81'),
+    }
+
+
+@pytest.fixture(scope="session")
+def rtsp_url(rtsp_credentials, dual_stream_rtsp_server):
+    """
+    Provide an RTSP URL for integration tests.
+    - If USE_REAL_CAMERA=true, use real device credentials.
+    - Otherwise, use the local dual-stream RTSP server.
+    """
+    use_real = os.getenv("USE_REAL_CAMERA", "false").lower() == "true"
+    if use_real:
+        creds = rtsp_credentials
+        # Construct the real device RTSP URL (adjust path as needed)
+        return build_axis_rtsp_url(
+            ip=creds["ip"],
+            username=creds["username"],
+            password=creds["password"],
+            video_source=1,
+            get_video_data=True,
+            get_application_data=True,
+            rtp_ext=False
+        )
+    else:
+        # Use the local dual-stream server (video + application data)
+        return dual_stream_rtsp_server
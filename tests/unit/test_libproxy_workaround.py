@@ -8,8 +8,9 @@ using mocked system conditions.
 import os
 import platform
 import subprocess
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+import sys
+import types
+from unittest.mock import patch
 
 import pytest
 
@@ -20,45 +21,72 @@ from ax_devil_rtsp.setup_workarounds.libproxy_segfault import (
     ensure_safe_environment
 )
 
+# The workaround only matters on Linux; set AX_DEVIL_RUN_LINUX_TESTS=1 to run
+# these tests elsewhere anyway.
+linux_only = pytest.mark.skipif(
+    platform.system() != 'Linux' and not os.environ.get('AX_DEVIL_RUN_LINUX_TESTS'),
+    reason='Linux-only workaround tests'
+)
 
-class TestLibproxySegfaultDetector:
-    """Test the vulnerability detection logic."""
+# Shared vulnerable-system assessment (VulnerabilityDetails is frozen)
+_UBUNTU_22_VULN = VulnerabilityDetails(
+    is_vulnerable=True,
+    os_info='Ubuntu 22.04',
+    gstreamer_version='1.20.3',
+    has_libproxy_module=True,
+    workaround_applied=False,
+    reasons=['Test reason']
+)
+
+
+@pytest.fixture
+def gio_module_dir_unset(monkeypatch):
+    """Unset GIO_MODULE_DIR for the test and restore its original state afterwards."""
+    # setenv first so monkeypatch records the original value (or its absence);
+    # apply() may set GIO_MODULE_DIR directly during the test
+    monkeypatch.setenv('GIO_MODULE_DIR', '')
+    monkeypatch.delenv('GIO_MODULE_DIR')
+
+
+def test_not_vulnerable_on_non_linux():
+    """Test that non-Linux systems are not vulnerable."""
+    detector = LibproxySegfaultDetector()
     
-    def test_not_vulnerable_on_non_linux(self):
-        """Test that non-Linux systems are not vulnerable."""
-        detector = LibproxySegfaultDetector()
+    with patch('platform.system', return_value='Windows'):
+        details = detector.get_vulnerability_details()
         
-        with patch('platform.system', return_value='Windows'):
-            details = detector.get_vulnerability_details()
-            
-        assert not details.is_vulnerable
-        assert details.os_info == 'Windows'
-        assert 'Not Linux - not vulnerable' in details.reasons
+    assert not details.is_vulnerable
+    assert details.os_info == 'Windows'
+    assert 'Not Linux - not vulnerable' in details.reasons
+
+
+@linux_only
+class TestLibproxySegfaultDetector:
+    """Test the vulnerability detection logic."""
     
-    def test_not_vulnerable_when_workaround_already_applied(self):
+    def test_not_vulnerable_when_workaround_already_applied(self, monkeypatch):
         """Test that systems with workaround applied are not vulnerable."""
         detector = LibproxySegfaultDetector()
         
-        with patch.dict(os.environ, {'GIO_MODULE_DIR': '/dev/null'}):
-            with patch('platform.system', return_value='Linux'):
-                with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04'):
-                    with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
-                        with patch.object(detector, '_has_libproxy_module', return_value=True):
-                            details = detector.get_vulnerability_details()
+        monkeypatch.setenv('GIO_MODULE_DIR', '/dev/null')
+        with patch('platform.system', return_value='Linux'):
+            with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04'):
+                with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
+                    with patch.object(detector, '_has_libproxy_module', return_value=True):
+                        details = detector.get_vulnerability_details()
         
         assert not details.is_vulnerable
         assert details.workaround_applied
     
     @patch('platform.system', return_value='Linux')
-    def test_vulnerable_ubuntu_22_old_gstreamer_with_module(self, mock_platform):
+    def test_vulnerable_ubuntu_22_old_gstreamer_with_module(self, mock_platform, gio_module_dir_unset):
         """Test detection of vulnerable system: Ubuntu 22.04 + old GStreamer + libproxy module."""
         detector = LibproxySegfaultDetector()
         
-        with patch.dict(os.environ, {}, clear=True):  # Clear GIO_MODULE_DIR
-            with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
-                with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
-                    with patch.object(detector, '_has_libproxy_module', return_value=True):
-                        details = detector.get_vulnerability_details()
+        with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
+            with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
+                with patch.object(detector, '_has_libproxy_module', return_value=True):
+                    details = detector.get_vulnerability_details()
         
         assert details.is_vulnerable
         assert 'Ubuntu 22.04 detected' in details.reasons
@@ -66,28 +94,26 @@ class TestLibproxySegfaultDetector:
         assert 'libgiolibproxy.so module present' in details.reasons
     
     @patch('platform.system', return_value='Linux')
-    def test_not_vulnerable_ubuntu_24_new_gstreamer(self, mock_platform):
+    def test_not_vulnerable_ubuntu_24_new_gstreamer(self, mock_platform, gio_module_dir_unset):
         """Test that Ubuntu 24.04 with new GStreamer is not vulnerable."""
         detector = LibproxySegfaultDetector()
         
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.object(detector, '_get_os_info', return_value='Ubuntu 24.04.1 LTS'):
-                with patch.object(detector, '_get_gstreamer_version', return_value='1.24.2'):
-                    with patch.object(detector, '_has_libproxy_module', return_value=True):
-                        details = detector.get_vulnerability_details()
+        with patch.object(detector, '_get_os_info', return_value='Ubuntu 24.04.1 LTS'):
+            with patch.object(detector, '_get_gstreamer_version', return_value='1.24.2'):
+                with patch.object(detector, '_has_libproxy_module', return_value=True):
+                    details = detector.get_vulnerability_details()
         
         assert not details.is_vulnerable
     
     @patch('platform.system', return_value='Linux')
-    def test_not_vulnerable_without_libproxy_module(self, mock_platform):
+    def test_not_vulnerable_without_libproxy_module(self, mock_platform, gio_module_dir_unset):
         """Test that systems without libproxy module are not vulnerable."""
         detector = LibproxySegfaultDetector()
         
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
-                with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
-                    with patch.object(detector, '_has_libproxy_module', return_value=False):
-                        details = detector.get_vulnerability_details()
+        with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
+            with patch.object(detector, '_get_gstreamer_version', return_value='1.20.3'):
+                with patch.object(detector, '_has_libproxy_module', return_value=False):
+                    details = detector.get_vulnerability_details()
         
         assert not details.is_vulnerable
     
@@ -130,10 +156,7 @@ class TestLibproxySegfaultDetector:
         detector = LibproxySegfaultDetector()
         
         # Mock successful subprocess call
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = '1.20.3\n'
-        mock_run.return_value = mock_result
+        mock_run.return_value = types.SimpleNamespace(returncode=0, stdout='1.20.3\n')
         
         version = detector._get_gstreamer_version()
         assert version == '1.20.3'
@@ -144,9 +167,7 @@ class TestLibproxySegfaultDetector:
         detector = LibproxySegfaultDetector()
         
         # Mock failed subprocess call
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_run.return_value = mock_result
+        mock_run.return_value = types.SimpleNamespace(returncode=1, stdout='', stderr='')
         
         version = detector._get_gstreamer_version()
         assert version is None
@@ -199,86 +220,88 @@ class TestLibproxySegfaultDetector:
         """Test that vulnerability details are cached."""
         detector = LibproxySegfaultDetector()
         
-        with patch.object(detector, '_assess_vulnerability') as mock_assess:
-            mock_details = VulnerabilityDetails(
-                is_vulnerable=False,
-                os_info='Test',
-                gstreamer_version=None,
-                has_libproxy_module=False,
-                workaround_applied=False,
-                reasons=['Test']
-            )
-            mock_assess.return_value = mock_details
-            
-            # First call should trigger assessment
-            details1 = detector.get_vulnerability_details()
-            
-            # Second call should use cache
-            details2 = detector.get_vulnerability_details()
-            
-            assert details1 is details2
-            mock_assess.assert_called_once()
+        mock_details = VulnerabilityDetails(
+            is_vulnerable=False,
+            os_info='Test',
+            gstreamer_version=None,
+            has_libproxy_module=False,
+            workaround_applied=False,
+            reasons=['Test']
+        )
+        calls = [0]
+        
+        def fake_assess():
+            calls[0] += 1
+            return mock_details
+        
+        detector._assess_vulnerability = fake_assess
+        
+        # First call should trigger assessment
+        details1 = detector.get_vulnerability_details()
+        
+        # Second call should use cache
+        details2 = detector.get_vulnerability_details()
+        
+        assert details1 is details2
+        assert calls[0] == 1
 
 
+@linux_only
 class TestLibproxyWorkaround:
     """Test the workaround application and validation."""
     
-    def test_is_applied_true(self):
+    def test_is_applied_true(self, monkeypatch):
         """Test detection when workaround is applied."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {'GIO_MODULE_DIR': '/dev/null'}):
-            assert workaround.is_applied() is True
+        monkeypatch.setenv('GIO_MODULE_DIR', '/dev/null')
+        assert workaround.is_applied() is True
     
-    def test_is_applied_false(self):
+    def test_is_applied_false(self, gio_module_dir_unset):
         """Test detection when workaround is not applied."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {}, clear=True):
-            assert workaround.is_applied() is False
+        assert workaround.is_applied() is False
     
-    def test_apply_when_already_applied(self):
+    def test_apply_when_already_applied(self, monkeypatch):
         """Test apply when workaround is already applied."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {'GIO_MODULE_DIR': '/dev/null'}):
-            result = workaround.apply()
+        monkeypatch.setenv('GIO_MODULE_DIR', '/dev/null')
+        result = workaround.apply()
             
         assert result is True
     
-    def test_apply_when_not_vulnerable(self):
+    def test_apply_when_not_vulnerable(self, gio_module_dir_unset):
         """Test apply when system is not vulnerable."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.object(workaround.detector, 'is_vulnerable', return_value=False):
-                result = workaround.apply()
+        with patch.object(workaround.detector, 'is_vulnerable', return_value=False):
+            result = workaround.apply()
         
         assert result is False
         assert os.environ.get('GIO_MODULE_DIR') != '/dev/null'
     
-    def test_apply_when_vulnerable(self):
+    def test_apply_when_vulnerable(self, gio_module_dir_unset):
         """Test apply when system is vulnerable."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.object(workaround.detector, 'is_vulnerable', return_value=True):
-                result = workaround.apply()
+        with patch.object(workaround.detector, 'is_vulnerable', return_value=True):
+            result = workaround.apply()
                 
-                # Check that the environment was modified
-                assert result is True
-                assert os.environ.get('GIO_MODULE_DIR') == '/dev/null'
+            # Check that the environment was modified
+            assert result is True
+            assert os.environ.get('GIO_MODULE_DIR') == '/dev/null'
     
-    def test_apply_force(self):
+    def test_apply_force(self, gio_module_dir_unset):
         """Test force apply regardless of vulnerability."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.object(workaround.detector, 'is_vulnerable', return_value=False):
-                result = workaround.apply(force=True)
+        with patch.object(workaround.detector, 'is_vulnerable', return_value=False):
+            result = workaround.apply(force=True)
                 
-                assert result is True
-                assert os.environ.get('GIO_MODULE_DIR') == '/dev/null'
+            assert result is True
+            assert os.environ.get('GIO_MODULE_DIR') == '/dev/null'
     
     @patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.logger')
     @patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.os.environ')
@@ -297,47 +320,39 @@ class TestLibproxyWorkaround:
         assert result is False
         mock_logger.error.assert_called_once()
     
-    def test_validate_not_applied(self):
+    def test_validate_not_applied(self, gio_module_dir_unset):
         """Test validation when workaround is not applied."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {}, clear=True):
-            result = workaround.validate()
+        result = workaround.validate()
             
         assert result is False
     
-    def test_validate_success(self):
+    def test_validate_success(self, monkeypatch):
         """Test successful validation."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {'GIO_MODULE_DIR': '/dev/null'}):
-            # Mock the imports inside the validate method
-            with patch('builtins.__import__') as mock_import:
-                # Mock gi module
-                mock_gi = MagicMock()
-                mock_gst = MagicMock()
-                mock_gst.is_initialized.return_value = True
-                
-                def import_side_effect(name, *args, **kwargs):
-                    if name == 'gi':
-                        return mock_gi
-                    return MagicMock()
-                    
-                mock_import.side_effect = import_side_effect
-                
-                # Mock the gi.repository import
-                with patch.dict('sys.modules', {'gi.repository': MagicMock(Gst=mock_gst)}):
-                    result = workaround.validate()
+        # Stub out gi so validate() imports it without touching GStreamer
+        gi = types.ModuleType("gi")
+        gi.require_version = lambda namespace, version: None
+        gi.repository = types.ModuleType("gi.repository")
+        gi.repository.Gst = types.SimpleNamespace(is_initialized=lambda: True)
+        monkeypatch.setitem(sys.modules, "gi", gi)
+        monkeypatch.setitem(sys.modules, "gi.repository", gi.repository)
+        
+        monkeypatch.setenv('GIO_MODULE_DIR', '/dev/null')
+        result = workaround.validate()
         
         assert result is True
     
-    def test_validate_failure(self):
+    def test_validate_failure(self, monkeypatch):
         """Test validation failure."""
         workaround = LibproxyWorkaround()
         
-        with patch.dict(os.environ, {'GIO_MODULE_DIR': '/dev/null'}):
-            with patch('builtins.__import__', side_effect=ImportError('Mock import error')):
-                result = workaround.validate()
+        # A None entry makes only "import gi" raise ImportError
+        monkeypatch.setitem(sys.modules, "gi", None)
+        monkeypatch.setenv('GIO_MODULE_DIR', '/dev/null')
+        result = workaround.validate()
         
         assert result is False
     
@@ -345,16 +360,7 @@ class TestLibproxyWorkaround:
         """Test status report generation."""
         workaround = LibproxyWorkaround()
         
-        mock_details = VulnerabilityDetails(
-            is_vulnerable=True,
-            os_info='Ubuntu 22.04',
-            gstreamer_version='1.20.3',
-            has_libproxy_module=True,
-            workaround_applied=False,
-            reasons=['Test reason']
-        )
-        
-        with patch.object(workaround.detector, 'get_vulnerability_details', return_value=mock_details):
+        with patch.object(workaround.detector, 'get_vulnerability_details', return_value=_UBUNTU_22_VULN):
             with patch.object(workaround, 'is_applied', return_value=True):
                 with patch.object(workaround, 'validate', return_value=True):
                     report = workaround.get_status_report()
@@ -370,6 +376,18 @@ class TestLibproxyWorkaround:
         assert report['validation_passed'] is True
 
 
+@pytest.fixture
+def mocked_libproxy():
+    """Patch detector and workaround classes for a vulnerable system; yields their instances."""
+    with patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxySegfaultDetector') as mock_detector_class, \
+            patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxyWorkaround') as mock_workaround_class:
+        mock_detector = mock_detector_class.return_value
+        mock_detector.is_vulnerable.return_value = True
+        mock_detector.get_vulnerability_details.return_value = _UBUNTU_22_VULN
+        yield mock_detector, mock_workaround_class.return_value
+
+
+@linux_only
 class TestEnsureSafeEnvironment:
     """Test the main entry point function."""
     
@@ -383,68 +401,33 @@ class TestEnsureSafeEnvironment:
             
         assert result is True
     
-    def test_vulnerable_system_workaround_success(self):
-        """Test ensure_safe_environment on vulnerable system with successful workaround."""
-        with patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxySegfaultDetector') as mock_detector_class:
-            with patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxyWorkaround') as mock_workaround_class:
-                
-                mock_detector = mock_detector_class.return_value
-                mock_detector.is_vulnerable.return_value = True
-                mock_detector.get_vulnerability_details.return_value = VulnerabilityDetails(
-                    is_vulnerable=True,
-                    os_info='Ubuntu 22.04',
-                    gstreamer_version='1.20.3',
-                    has_libproxy_module=True,
-                    workaround_applied=False,
-                    reasons=['Test reason']
-                )
-                
-                mock_workaround = mock_workaround_class.return_value
-                mock_workaround.apply.return_value = True
-                
-                result = ensure_safe_environment()
-                
-        assert result is True
-    
-    def test_vulnerable_system_workaround_failure(self):
-        """Test ensure_safe_environment on vulnerable system with failed workaround."""
-        with patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxySegfaultDetector') as mock_detector_class:
-            with patch('ax_devil_rtsp.setup_workarounds.libproxy_segfault.LibproxyWorkaround') as mock_workaround_class:
-                
-                mock_detector = mock_detector_class.return_value
-                mock_detector.is_vulnerable.return_value = True
-                mock_detector.get_vulnerability_details.return_value = VulnerabilityDetails(
-                    is_vulnerable=True,
-                    os_info='Ubuntu 22.04',
-                    gstreamer_version='1.20.3',
-                    has_libproxy_module=True,
-                    workaround_applied=False,
-                    reasons=['Test reason']
-                )
-                
-                mock_workaround = mock_workaround_class.return_value
-                mock_workaround.apply.return_value = False
-                
-                result = ensure_safe_environment()
-                
-        assert result is False
+    @pytest.mark.parametrize("apply_result,expected", [
+        (True, True),    # Workaround applied
+        (False, False),  # Workaround failed
+    ])
+    def test_vulnerable_system(self, mocked_libproxy, apply_result, expected):
+        """Test ensure_safe_environment on vulnerable system, with and without a successful workaround."""
+        _, mock_workaround = mocked_libproxy
+        mock_workaround.apply.return_value = apply_result
+        
+        assert ensure_safe_environment() is expected
 
 
+@linux_only
 @pytest.mark.parametrize("os_name,gst_version,has_module,expected", [
     ("Windows", None, False, False),          # Not Linux
     ("Linux", "1.24.2", True, False),        # New GStreamer
     ("Linux", "1.20.3", False, False),       # No module
     ("Linux", "1.20.3", True, True),         # Vulnerable
 ])
-def test_vulnerability_combinations(os_name, gst_version, has_module, expected):
+def test_vulnerability_combinations(os_name, gst_version, has_module, expected, gio_module_dir_unset):
     """Test various combinations of system conditions."""
     detector = LibproxySegfaultDetector()
     
-    with patch.dict(os.environ, {}, clear=True):  # No workaround applied
-        with patch('platform.system', return_value=os_name):
-            with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
-                with patch.object(detector, '_get_gstreamer_version', return_value=gst_version):
-                    with patch.object(detector, '_has_libproxy_module', return_value=has_module):
-                        result = detector.is_vulnerable()
+    with patch('platform.system', return_value=os_name):
+        with patch.object(detector, '_get_os_info', return_value='Ubuntu 22.04.3 LTS'):
+            with patch.object(detector, '_get_gstreamer_version', return_value=gst_version):
+                with patch.object(detector, '_has_libproxy_module', return_value=has_module):
+                    result = detector.is_vulnerable()
     
     assert result == expected
\ No newline at end of file
@@ -3,139 +3,117 @@ Unit test for retriever lifecycle management.
 """
 
 import pytest
-import time
 from unittest.mock import Mock, patch
 from ax_devil_rtsp.rtsp_data_retrievers import RtspVideoDataRetriever
 
 
-def test_multiple_start_stop_cycles():
+@pytest.fixture
+def video_retriever():
+    """
+    Provide a retriever for a dummy URL, stopped again after the test.
+    """
+    retriever = RtspVideoDataRetriever(rtsp_url="rtsp://test.url/stream")
+    yield retriever
+    if retriever.is_running:
+        retriever.stop()
+
+
+@pytest.fixture
+def mock_process():
+    """
+    Patch multiprocessing.Process and multiprocessing.Queue in one context.
+
+    Yields the mock process returned by Process(), initially alive with no exit code.
+    """
+    with patch('multiprocessing.Process') as mock_process_class, \
+            patch('multiprocessing.Queue'):
+        process = Mock()
+        process.is_alive.return_value = True
+        process.exitcode = None  # Process is alive, no exit code yet
+        mock_process_class.return_value = process
+        yield process
+
+
+def test_multiple_start_stop_cycles(video_retriever, mock_process):
     """
     Test that retrievers can handle multiple start/stop cycles safely.
     """
-    retriever = RtspVideoDataRetriever(
-        rtsp_url="rtsp://test.url/stream",
-        connection_timeout=5
-    )
-    
     # Initially not running
-    assert not retriever.is_running
-    
+    assert not video_retriever.is_running
+
     # Test multiple cycles
     for i in range(3):
-        # Mock the process to avoid actual RTSP connection
-        with patch('multiprocessing.Process') as mock_process_class:
-            mock_process = Mock()
-            mock_process.is_alive.return_value = True
-            mock_process.exitcode = None  # Process is alive, no exit code yet
-            mock_process_class.return_value = mock_process
-            
-            with patch('multiprocessing.Queue'):
-                retriever.start()
-                assert retriever.is_running
-                
-                # When stopping, process becomes dead with exit code
-                mock_process.is_alive.return_value = False
-                mock_process.exitcode = 0  # Normal termination
-                retriever.stop()
-                assert not retriever.is_running
-
-
-def test_stop_without_start():
+        mock_process.is_alive.return_value = True
+        mock_process.exitcode = None
+        video_retriever.start()
+        assert video_retriever.is_running
+
+        # When stopping, process becomes dead with exit code
+        mock_process.is_alive.return_value = False
+        mock_process.exitcode = 0  # Normal termination
+        video_retriever.stop()
+        assert not video_retriever.is_running
+
+
+def test_stop_without_start(video_retriever):
     """
     Test that calling stop() without start() is safe.
     """
-    retriever = RtspVideoDataRetriever(
-        rtsp_url="rtsp://test.url/stream"
-    )
-    
     # Should be safe to call stop without start
-    retriever.stop()
-    assert not retriever.is_running
-    
+    video_retriever.stop()
+    assert not video_retriever.is_running
+
     # Multiple stops should also be safe
-    retriever.stop()
-    retriever.stop()
-    assert not retriever.is_running
+    video_retriever.stop()
+    video_retriever.stop()
+    assert not video_retriever.is_running
 
 
-def test_start_when_already_started():
+def test_start_when_already_started(video_retriever, mock_process):
     """
     Test that starting an already started retriever raises an error.
     """
-    retriever = RtspVideoDataRetriever(
-        rtsp_url="rtsp://test.url/stream"
-    )
-    
-    with patch('multiprocessing.Process') as mock_process_class:
-        mock_process = Mock()
-        mock_process.is_alive.return_value = True
-        mock_process.exitcode = None  # Process is alive, no exit code yet
-        mock_process_class.return_value = mock_process
-        
-        with patch('multiprocessing.Queue'):
-            retriever.start()
-            
-            # Starting again should raise error
-            with pytest.raises(RuntimeError, match="already started"):
-                retriever.start()
-            
-            # When stopping, process becomes dead with exit code
-            mock_process.is_alive.return_value = False
-            mock_process.exitcode = 0  # Normal termination
-            retriever.stop()
-
-
-def test_is_running_property():
+    video_retriever.start()
+
+    # Starting again should raise error
+    with pytest.raises(RuntimeError, match="already started"):
+        video_retriever.start()
+
+    # When stopping, process becomes dead with exit code
+    mock_process.is_alive.return_value = False
+    mock_process.exitcode = 0  # Normal termination
+    video_retriever.stop()
+
+
+def test_is_running_property(video_retriever, mock_process):
     """
     Test that is_running property accurately reflects retriever state.
     """
-    retriever = RtspVideoDataRetriever(
-        rtsp_url="rtsp://test.url/stream"
-    )
-    
     # Initially not running
-    assert not retriever.is_running
-    
-    with patch('multiprocessing.Process') as mock_process_class:
-        mock_process = Mock()
-        mock_process_class.return_value = mock_process
-        
-        with patch('multiprocessing.Queue'):
-            # When process is alive, should be running
-            mock_process.is_alive.return_value = True
-            mock_process.exitcode = None  # Process is alive, no exit code yet
-            retriever.start()
-            assert retriever.is_running
-            
-            # When process is dead, should not be running
-            mock_process.is_alive.return_value = False
-            mock_process.exitcode = 0  # Process has exited normally
-            assert not retriever.is_running
-            
-            retriever.stop()
-            assert not retriever.is_running
-
-
-def test_close_method():
+    assert not video_retriever.is_running
+
+    # When process is alive, should be running
+    video_retriever.start()
+    assert video_retriever.is_running
+
+    # When process is dead, should not be running
+    mock_process.is_alive.return_value = False
+    mock_process.exitcode = 0  # Process has exited normally
+    assert not video_retriever.is_running
+
+    video_retriever.stop()
+    assert not video_retriever.is_running
+
+
+def test_close_method(video_retriever, mock_process):
     """
     Test that close() method works as alias for stop().
     """
-    retriever = RtspVideoDataRetriever(
-        rtsp_url="rtsp://test.url/stream"
-    )
-    
-    with patch('multiprocessing.Process') as mock_process_class:
-        mock_process = Mock()
-        mock_process.is_alive.return_value = True
-        mock_process.exitcode = None  # Process is alive, no exit code yet
-        mock_process_class.return_value = mock_process
-        
-        with patch('multiprocessing.Queue'):
-            retriever.start()
-            assert retriever.is_running
-            
-            # When closing, process becomes dead with exit code
-            mock_process.is_alive.return_value = False
-            mock_process.exitcode = 0  # Normal termination
-            retriever.close()  # Should work like stop()
-            assert not retriever.is_running 
\ No newline at end of file
+    video_retriever.start()
+    assert video_retriever.is_running
+
+    # When closing, process becomes dead with exit code
+    mock_process.is_alive.return_value = False
+    mock_process.exitcode = 0  # Normal termination
+    video_retriever.close()  # Should work like stop()
+    assert not video_retriever.is_running
@@ -1,69 +1,111 @@
 import logging
 import logging.handlers as log_handlers
-import multiprocessing as mp
+import queue
 
 import pytest
 
-from ax_devil_rtsp.utils.logging import setup_logging
+from ax_devil_rtsp.utils.logging import get_logger, setup_logging
 
 
-def _cleanup(logger: logging.Logger) -> None:
-    for handler in list(logger.handlers):
-        handler.close()
-        logger.removeHandler(handler)
+@pytest.fixture(autouse=True)
+def _isolate_loggers():
+    """Restore root and ax-devil-rtsp loggers, closing any handlers a test added."""
+    loggers = (logging.getLogger(), get_logger(""))
+    snapshots = [(lg, list(lg.handlers), lg.level, lg.propagate) for lg in loggers]
+    yield
+    for lg, prev_handlers, prev_level, prev_propagate in snapshots:
+        for handler in lg.handlers:
+            if handler not in prev_handlers:
+                handler.close()
+        lg.handlers = prev_handlers
+        lg.setLevel(prev_level)
+        lg.propagate = prev_propagate
 
 
-def test_setup_logging_accepts_string_level(tmp_path):
-    logger = setup_logging(log_level="DEBUG", logs_dir=tmp_path, log_to_file=False)
-    try:
-        assert logger.getEffectiveLevel() == logging.DEBUG
-        console_handlers = [
-            handler for handler in logger.handlers if isinstance(handler, logging.StreamHandler)
-        ]
-        assert console_handlers
-        assert {handler.level for handler in console_handlers} == {logging.DEBUG}
-    finally:
-        _cleanup(logger)
+@pytest.fixture(scope="module")
+def logs_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("logs")
 
 
-def test_setup_logging_creates_expected_files(tmp_path):
-    logger = setup_logging(log_level=logging.INFO, logs_dir=tmp_path)
-    try:
-        assert (tmp_path / "ax-devil-rtsp.log").exists()
-    finally:
-        _cleanup(logger)
+@pytest.fixture
+def logs_dir(logs_root, request):
+    """Per-test log directory under the shared module-level root."""
+    path = logs_root / request.node.name
+    path.mkdir(exist_ok=True)
+    return path
 
 
-def test_queue_only_sets_queue_handler(tmp_path):
-    log_queue = mp.Queue()
+@pytest.mark.parametrize(
+    "log_level, expected",
+    [("DEBUG", logging.DEBUG), ("warning", logging.WARNING), (logging.DEBUG, logging.DEBUG)],
+)
+def test_setup_logging_accepts_string_and_numeric_level(logs_dir, log_level, expected):
+    logger = setup_logging(log_level=log_level, logs_dir=logs_dir, log_to_file=False)
+    assert logger.getEffectiveLevel() == expected
+    console_handlers = [
+        handler for handler in logger.handlers if isinstance(handler, logging.StreamHandler)
+    ]
+    assert console_handlers
+    assert {handler.level for handler in console_handlers} == {expected}
+
+
+def test_setup_logging_rejects_invalid_level_type(logs_dir):
+    with pytest.raises(TypeError):
+        setup_logging(log_level=1.5, logs_dir=logs_dir, log_to_file=False)
+
+
+def test_setup_logging_creates_expected_files(logs_dir):
+    setup_logging(log_level=logging.INFO, logs_dir=logs_dir)
+    assert (logs_dir / "ax-devil-rtsp.log").exists()
+
+
+def test_repeated_setup_logging_does_not_accumulate_handlers(logs_dir):
+    first = setup_logging(log_level=logging.INFO, logs_dir=logs_dir)
+    handler_count = len(first.handlers)
+    for _ in range(3):
+        logger = setup_logging(log_level=logging.INFO, logs_dir=logs_dir)
+    assert logger is first
+    assert len(logger.handlers) == handler_count
+
+
+def test_queue_only_sets_queue_handler(logs_dir):
+    log_queue = queue.SimpleQueue()
     logger = setup_logging(
         log_level=logging.INFO,
-        logs_dir=tmp_path,
+        logs_dir=logs_dir,
         queue_only=True,
         log_queue=log_queue,
         log_to_file=False,
         console=False,
     )
-    try:
-        assert logger.handlers
-        assert all(isinstance(h, log_handlers.QueueHandler) for h in logger.handlers)
-    finally:
-        _cleanup(logger)
-        log_queue.close()
+    assert logger.handlers
+    assert all(isinstance(h, log_handlers.QueueHandler) for h in logger.handlers)
 
 
-def test_setup_logging_creates_parent_for_custom_log_file(tmp_path):
-    custom_log = tmp_path / "nested" / "deep" / "custom.log"
+def test_setup_logging_creates_parent_for_custom_log_file(logs_dir):
+    custom_log = logs_dir / "nested" / "deep" / "custom.log"
     logger = setup_logging(
         log_level="INFO",
         log_file=custom_log,
+        logs_dir=logs_dir,
         log_to_file=True,
         console=False,
     )
-    try:
-        logger.info("hello")
-        for handler in logger.handlers:
-            handler.flush()
-        assert custom_log.exists()
-    finally:
-        _cleanup(logger)
+    logger.info("hello")
+    for handler in logger.handlers:
+        handler.flush()
+    assert custom_log.exists()
+
+
+def test_logging_namespace_and_defaults(logs_dir, caplog):
+    """`get_logger` should use the ax-devil-rtsp namespace and defaults."""
+    caplog.set_level(logging.INFO)
+
+    logger = setup_logging(logs_dir=logs_dir)
+    assert logger.name == "ax-devil-rtsp"
+
+    child_logger = get_logger("example")
+    child_logger.info("namespace check")
+
+    assert child_logger.name == "ax-devil-rtsp.example"
+    assert (logs_dir / "ax-devil-rtsp.log").exists()
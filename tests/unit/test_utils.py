@@ -0,0 +1,247 @@
+"""
+Unit tests for metadata and caps parsing helpers.
+"""
+
+import json
+
+import pytest
+
+from ax_devil_rtsp import utils
+from ax_devil_rtsp.utils import (
+    DetectedObject,
+    _parse_caps_string,
+    parse_axis_scene_metadata_xml,
+    parse_session_metadata,
+)
+
+
+VALID_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<tt:MetadataStream xmlns:tt="http://www.onvif.org/ver10/schema">
+  <tt:VideoAnalytics>
+    <tt:Frame UtcTime="2024-01-01T12:00:00.000Z">
+      <tt:Object ObjectId="1">
+        <tt:Appearance>
+          <tt:Class>
+            <tt:Type Likelihood="0.9">Human</tt:Type>
+          </tt:Class>
+        </tt:Appearance>
+      </tt:Object>
+      <tt:Object ObjectId="2">
+        <tt:Appearance>
+          <tt:Class>
+            <tt:Type Likelihood="0.8">Vehicle</tt:Type>
+          </tt:Class>
+        </tt:Appearance>
+      </tt:Object>
+    </tt:Frame>
+  </tt:VideoAnalytics>
+</tt:MetadataStream>"""
+
+EMPTY_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<tt:MetadataStream xmlns:tt="http://www.onvif.org/ver10/schema">
+  <tt:VideoAnalytics>
+    <tt:Frame UtcTime="2024-01-01T12:00:01.000Z"/>
+  </tt:VideoAnalytics>
+</tt:MetadataStream>"""
+
+INVALID_XML = b"<invalid>xml<content>"
+
+BAD_UTF8 = b'<?xml version="1.0" encoding="UTF-8"?><test>\xff\xfe</test>'
+
+NESTED_XML = b"""<tt:MetadataStream xmlns:tt="http://www.onvif.org/ver10/schema">
+  <tt:Frame UtcTime="2024-01-01T12:00:03.000Z">
+    <tt:Object ObjectId="1">
+      <tt:Object ObjectId="2"><tt:Type>A</tt:Type></tt:Object>
+      <tt:Type>B</tt:Type>
+    </tt:Object>
+  </tt:Frame>
+</tt:MetadataStream>"""
+
+
+@pytest.fixture(params=["expat", "lxml"])
+def scene_backend(request, monkeypatch):
+    """Run a scene parsing test against each XML backend."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(utils, "_HAS_LXML", request.param == "lxml")
+    return request.param
+
+
+def test_parse_valid_scene_metadata(scene_backend):
+    result = parse_axis_scene_metadata_xml(VALID_XML)
+
+    assert result["utc_time"] == "2024-01-01T12:00:00.000Z"
+    assert [(obj.id, obj.type) for obj in result["objects"]] == [
+        ("1", "Human"),
+        ("2", "Vehicle"),
+    ]
+    # Mapping-style access is kept for existing callers
+    assert result["objects"][0]["type"] == "Human"
+
+
+def test_detected_object_behaves_like_the_old_dict():
+    obj = DetectedObject("1", "Human")
+    as_dict = {"id": "1", "type": "Human"}
+
+    assert "type" in obj and "score" not in obj
+    assert obj.get("type") == "Human"
+    assert obj.get("score") is None
+    assert list(obj.keys()) == ["id", "type"]
+    assert dict(obj) == as_dict
+    assert obj == as_dict and obj == DetectedObject("1", "Human")
+    assert obj != DetectedObject("1", "Vehicle")
+    assert hash(obj) == hash(DetectedObject("1", "Human"))
+    assert obj.to_dict() == as_dict
+    assert json.loads(json.dumps(obj.to_dict())) == as_dict
+    with pytest.raises(KeyError):
+        obj["score"]
+
+
+def test_parse_interns_object_types(scene_backend):
+    first = parse_axis_scene_metadata_xml(VALID_XML)["objects"][0]
+    second = parse_axis_scene_metadata_xml(VALID_XML)["objects"][0]
+
+    assert first.type is second.type
+
+
+def test_parse_scene_metadata_without_objects(scene_backend):
+    result = parse_axis_scene_metadata_xml(EMPTY_XML)
+
+    assert result["utc_time"] == "2024-01-01T12:00:01.000Z"
+    assert result["objects"] == []
+
+
+def test_parse_skips_objects_without_type(scene_backend):
+    xml_data = b"""<tt:MetadataStream xmlns:tt="http://www.onvif.org/ver10/schema">
+  <tt:Frame UtcTime="2024-01-01T12:00:02.000Z">
+    <tt:Object ObjectId="7"><tt:Appearance/></tt:Object>
+    <tt:Object ObjectId="8"><tt:Class><tt:Type>Face</tt:Type></tt:Class></tt:Object>
+  </tt:Frame>
+</tt:MetadataStream>"""
+    result = parse_axis_scene_metadata_xml(xml_data)
+
+    assert [(obj.id, obj.type) for obj in result["objects"]] == [("8", "Face")]
+
+
+def test_parse_invalid_xml_returns_empty_result(scene_backend):
+    result = parse_axis_scene_metadata_xml(INVALID_XML)
+
+    assert result["objects"] == []
+    assert result["utc_time"] is None
+
+
+def test_parse_bad_utf8_does_not_raise(scene_backend):
+    result = parse_axis_scene_metadata_xml(BAD_UTF8)
+
+    assert result["objects"] == []
+    assert result["utc_time"] is None
+
+
+def test_parse_drops_invalid_utf8_bytes(scene_backend):
+    result = parse_axis_scene_metadata_xml(VALID_XML.replace(b"Human", b"Hu\xffman"))
+
+    assert [(obj.id, obj.type) for obj in result["objects"]] == [
+        ("1", "Human"),
+        ("2", "Vehicle"),
+    ]
+
+
+def test_parse_nested_objects_in_document_order(scene_backend):
+    result = parse_axis_scene_metadata_xml(NESTED_XML)
+
+    # Each object takes the first Type below it, as ElementTree's find() would
+    assert [(obj.id, obj.type) for obj in result["objects"]] == [("1", "A"), ("2", "A")]
+
+
+@pytest.mark.parametrize("xml_data", [VALID_XML[:-40], VALID_XML + b"\x00"])
+def test_parse_broken_document_returns_empty_result(scene_backend, xml_data):
+    result = parse_axis_scene_metadata_xml(xml_data)
+
+    assert result["objects"] == []
+    assert result["utc_time"] is None
+
+
+def test_parse_after_invalid_xml_is_unaffected(scene_backend):
+    for xml_data in (VALID_XML, INVALID_XML, b"", VALID_XML):
+        result = parse_axis_scene_metadata_xml(xml_data)
+
+    assert [obj.id for obj in result["objects"]] == ["1", "2"]
+
+
+def test_raw_xml_is_the_input_bytes(scene_backend):
+    for xml_data in (VALID_XML, INVALID_XML):
+        assert parse_axis_scene_metadata_xml(xml_data)["raw_xml"] is xml_data
+
+
+def test_parse_objects_as_array(scene_backend):
+    np = pytest.importorskip("numpy")
+    result = parse_axis_scene_metadata_xml(VALID_XML, as_array=True)
+
+    array = result["objects_array"]
+    assert array.dtype.names == ("id", "type")
+    assert array["id"].tolist() == ["1", "2"]
+    assert np.count_nonzero(array["type"] == "Human") == 1
+    assert len(parse_axis_scene_metadata_xml(INVALID_XML, as_array=True)["objects_array"]) == 0
+    assert "objects_array" not in parse_axis_scene_metadata_xml(VALID_XML)
+
+
+def test_parse_caps_string_converts_types():
+    caps = (
+        "application/x-rtp, media=(string)video, clock-rate=(int)90000, "
+        "a-framerate=(string)\"30\\,000\", payload=(int)96, scale=(double)1.5, "
+        "enabled=(boolean)true"
+    )
+    parsed = _parse_caps_string(caps)
+
+    assert parsed["media"] == "video"
+    assert parsed["clock-rate"] == 90000
+    assert parsed["a-framerate"] == "30,000"
+    assert parsed["payload"] == 96
+    assert parsed["scale"] == 1.5
+    assert parsed["enabled"] is True
+
+
+def test_parse_caps_string_returns_independent_dicts():
+    caps = "video/x-raw, format=(string)RGB, width=(int)640"
+    first = _parse_caps_string(caps)
+    first["width"] = 0
+
+    assert _parse_caps_string(caps)["width"] == 640
+
+
+def test_parse_session_metadata():
+    raw = {
+        "stream_name": "recv_rtp_src_0",
+        "caps": "application/x-rtp, media=(string)video, payload=(int)96",
+        "structure": "application/x-rtp-source-stats, ssrc=(uint)1234",
+        "sdes": {"cname": "camera"},
+    }
+    parsed = parse_session_metadata(raw)
+
+    assert parsed["stream_name"] == "recv_rtp_src_0"
+    assert parsed["caps"] == raw["caps"]
+    assert parsed["caps_parsed"] == {"media": "video", "payload": 96}
+    assert parsed["structure_parsed"] == {"ssrc": 1234}
+    assert parsed["sdes"] == {"cname": "camera"}
+
+
+def test_parse_session_metadata_without_sdes():
+    raw = {
+        "stream_name": "recv_rtp_src_0",
+        "caps": "application/x-rtp, payload=(int)96",
+        "structure": "application/x-rtp, payload=(int)96",
+    }
+
+    assert parse_session_metadata(raw) == {
+        "stream_name": "recv_rtp_src_0",
+        "caps": raw["caps"],
+        "caps_parsed": {"payload": 96},
+        "structure": raw["structure"],
+        "structure_parsed": {"payload": 96},
+    }
+    # Non-string fields are still skipped, as in the general path
+    assert parse_session_metadata({**raw, "caps": None}) == {
+        "stream_name": "recv_rtp_src_0",
+        "structure": raw["structure"],
+        "structure_parsed": {"payload": 96},
+    }
@@ -5,9 +5,6 @@ These tests verify the video processing function behavior, signature validation,
 and payload processing in the GStreamer client.
 """
 
-import time
-import numpy as np
-from unittest.mock import patch, MagicMock
 from ax_devil_rtsp.gstreamer import CombinedRTSPClient
 
 
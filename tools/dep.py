@@ -9,12 +9,26 @@ and what needs to be installed by using a single source of truth for all depende
 Usage:
     python tools/dep.py --check      # Check dependencies (default)
     python tools/dep.py --install    # Show installation commands
+    python tools/dep.py --check --force  # Re-check, ignoring cached results
     python tools/dep.py --help       # Show this help message
+
+A successful import check is cached for a day under $XDG_CACHE_HOME/ax-devil-rtsp
+(~/.cache by default), keyed on the interpreter, ENVIRONMENT_VARS and the
+modification times of the site-packages and typelib directories.
+
+Set AX_DEVIL_SKIP_GST_INIT=1 to skip Gst.init() during --check when only
+importability matters (e.g. in CI).
 """
 
 import sys
 import os
 import argparse
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
+import time
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
@@ -43,6 +57,8 @@ PYTHON_DEPENDENCIES = [
     PythonDependency("gi", "PyGObject - Python GObject bindings", "gi", "system-package"),
 ]
 
+_PYTHON_DEPS_BY_NAME = {dep.name: dep for dep in PYTHON_DEPENDENCIES}
+
 SYSTEM_DEPENDENCIES = [
     # Core development packages
     SystemDependency(
@@ -97,7 +113,7 @@ SYSTEM_DEPENDENCIES = [
     ),
 ]
 
-ENVIRONMENT_VARS = [
+ENVIRONMENT_VARS = (
     'USE_REAL_CAMERA',
     'AX_DEVIL_TARGET_USER', 
     'AX_DEVIL_TARGET_PASS',
@@ -105,8 +121,38 @@ ENVIRONMENT_VARS = [
     'PYTHONPATH',
     'GIO_MODULE_DIR',
     'AX_DEVIL_DISABLE_WORKAROUNDS',
-    'AX_DEVIL_FORCE_LIBPROXY_WORKAROUND'
-]
+    'AX_DEVIL_FORCE_LIBPROXY_WORKAROUND',
+    'AX_DEVIL_SKIP_GST_INIT'
+)
+
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# First lines of the ENVIRONMENT INFO section. sys.version can contain a
+# newline before the compiler details; keep it on one line.
+_ENV_HEADER = (
+    f"Python version: {sys.version.replace(chr(10), ' ')}\n"
+    f"Python executable: {sys.executable}\n"
+    f"Platform: {sys.platform}"
+)
+
+
+def _check_module(dep: PythonDependency) -> None:
+    """Import a regular Python module and report its version."""
+    # Cheap spec lookup first so missing packages fail without an import attempt
+    if importlib.util.find_spec(dep.import_name) is None:
+        raise ImportError(f"No module named '{dep.import_name}'")
+    module = importlib.import_module(dep.import_name)
+    version = getattr(module, '__version__', 'unknown')
+    print(f"  └─ {dep.import_name}: ✅ (version: {version})")
+
+
+def _check_gst_init(Gst) -> None:
+    """Initialise GStreamer; loads the plugin registry, so it can be skipped."""
+    if os.environ.get('AX_DEVIL_SKIP_GST_INIT', '').lower() in ('1', 'true', 'yes'):
+        print("  └─ Gst.init(): skipped (AX_DEVIL_SKIP_GST_INIT set)")
+        return
+    Gst.init(None)
+    print("  └─ Gst.init(): ✅")
 
 
 def test_python_import(dep: PythonDependency) -> bool:
@@ -127,12 +173,9 @@ def test_python_import(dep: PythonDependency) -> bool:
             print(f"  └─ GLib: ✅")
             
             # Test GStreamer initialization
-            Gst.init(None)
-            print(f"  └─ Gst.init(): ✅")
+            _check_gst_init(Gst)
         else:
-            module = __import__(dep.import_name)
-            version = getattr(module, '__version__', 'unknown')
-            print(f"  └─ {dep.import_name}: ✅ (version: {version})")
+            _check_module(dep)
             
         return True
         
@@ -144,13 +187,12 @@ def test_python_import(dep: PythonDependency) -> bool:
 def check_environment() -> None:
     """Print environment information."""
     print("=== ENVIRONMENT INFO ===")
-    print(f"Python version: {sys.version}")
-    print(f"Python executable: {sys.executable}")
-    print(f"Platform: {sys.platform}")
+    print(_ENV_HEADER)
     
     print(f"\n=== ENVIRONMENT VARIABLES ===")
+    env = os.environ
     for var in ENVIRONMENT_VARS:
-        value = os.getenv(var, '<not set>')
+        value = env.get(var, '<not set>')
         print(f"{var}: {value}")
 
 
@@ -201,13 +243,18 @@ def check_workarounds() -> bool:
         return False
 
 
-def check_dependencies() -> Tuple[List[str], bool]:
-    """Check all dependencies and return failed ones."""
+def print_report_header() -> None:
+    """Print the report banner, environment info and workaround status."""
     print("🔍 ax-devil-rtsp Dependency Checker")
     print("=" * 50)
     
     check_environment()
     check_workarounds()
+
+
+def check_dependencies() -> Tuple[List[str], bool]:
+    """Check all dependencies and return failed ones."""
+    print_report_header()
     
     print(f"\n=== TESTING PYTHON IMPORTS ===")
     
@@ -221,6 +268,62 @@ def check_dependencies() -> Tuple[List[str], bool]:
     return failed_imports, len(failed_imports) == 0
 
 
+def _install_dirs() -> List[str]:
+    """Directories whose contents change when checked packages are (un)installed."""
+    dirs = [p for p in sys.path if p.endswith(("site-packages", "dist-packages"))]
+    # GObject introspection typelibs (gir1.2-* packages)
+    dirs.extend(p for p in os.getenv("GI_TYPELIB_PATH", "").split(os.pathsep) if p)
+    dirs.extend(glob.glob("/usr/lib*/girepository-1.0"))
+    dirs.extend(glob.glob("/usr/lib/*/girepository-1.0"))
+    dirs.extend(glob.glob("/usr/local/lib*/girepository-1.0"))
+    return dirs
+
+
+def _dir_mtime(path: str) -> str:
+    try:
+        return str(os.stat(path).st_mtime_ns)
+    except OSError:
+        return ""
+
+
+def _cache_path() -> str:
+    """Cache file for this interpreter, installed packages and environment."""
+    gi_spec = importlib.util.find_spec("gi")
+    key = "\0".join([
+        sys.executable,
+        sys.version,
+        gi_spec.origin if gi_spec and gi_spec.origin else "",
+        *(os.getenv(var, "") for var in ENVIRONMENT_VARS),
+        # Installing or removing a package or typelib touches its directory
+        *(f"{d}={_dir_mtime(d)}" for d in _install_dirs()),
+    ])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "ax-devil-rtsp", f"deps-{digest}.json")
+
+
+def load_cached_success(path: str) -> Optional[float]:
+    """Return the time of a cached successful check if it is still fresh."""
+    try:
+        with open(path) as f:
+            checked_at = float(json.load(f)["ts"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if time.time() - checked_at > CACHE_TTL_SECONDS:
+        return None
+    return checked_at
+
+
+def store_success(path: str) -> None:
+    """Record a successful check; failing to write the cache is not an error."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"ts": time.time(), "python": sys.version}, f)
+    except OSError:
+        pass
+
+
 def print_troubleshooting(failed_imports: List[str]) -> None:
     """Print troubleshooting information for failed imports."""
     if not failed_imports:
@@ -228,12 +331,9 @@ def print_troubleshooting(failed_imports: List[str]) -> None:
         
     print(f"\n💡 Manual installation options:")
     
-    # Create lookup for failed dependencies
-    failed_deps = {dep.name: dep for dep in PYTHON_DEPENDENCIES if dep.name in failed_imports}
-    
     for name in failed_imports:
-        if name in failed_deps:
-            dep = failed_deps[name]
+        dep = _PYTHON_DEPS_BY_NAME.get(name)
+        if dep is not None:
             if dep.pip_package == "system-package":
                 print(f"   • {dep.description}: Install via system package manager")
                 print(f"     Ubuntu/Debian: sudo apt install python3-gi gobject-introspection")
@@ -243,21 +343,31 @@ def print_troubleshooting(failed_imports: List[str]) -> None:
     print(f"\n🛠️  Get install commands: python tools/dep.py --install")
 
 
-def generate_install_commands() -> List[str]:
-    """Generate the commands needed to install all dependencies."""
+def generate_install_commands(recommends: bool = False) -> List[str]:
+    """Generate the commands needed to install all dependencies.
+
+    Recommended packages are skipped unless recommends is True; the media
+    packages otherwise pull in large optional chains.
+    """
     commands = []
     
-    # Update package lists
-    commands.append("sudo apt-get update")
+    # Update package lists (skipping translation files)
+    commands.append("sudo apt-get update -o Acquire::Languages=none")
     
     # Collect all system packages into one command for efficiency
     all_packages = []
     for dep in SYSTEM_DEPENDENCIES:
         all_packages.extend(dep.ubuntu_packages)
     
-    # Create install command
-    packages_str = " ".join(all_packages)
-    commands.append(f"sudo apt-get install -y {packages_str}")
+    # Create install command; non-interactive and without a pty so it also
+    # runs unattended in CI
+    # Groups may share packages; keep first occurrence order
+    packages_str = " ".join(dict.fromkeys(all_packages))
+    recommends_flag = "" if recommends else " --no-install-recommends"
+    commands.append(
+        f"sudo DEBIAN_FRONTEND=noninteractive apt-get install -y{recommends_flag} "
+        f"-o Dpkg::Use-Pty=0 {packages_str}"
+    )
     
     # Python dependencies
     commands.append("python -m pip install -e \".[dev]\"")
@@ -265,7 +375,7 @@ def generate_install_commands() -> List[str]:
     return commands
 
 
-def print_install_commands() -> None:
+def print_install_commands(recommends: bool = False) -> None:
     """Print installation commands for user to copy and run."""
     print("🔧 ax-devil-rtsp Installation Commands (Ubuntu/Debian)")
     print("=" * 60)
@@ -278,7 +388,7 @@ def print_install_commands() -> None:
     print("\n📋 Copy and run these commands:")
     print()
     
-    commands = generate_install_commands()
+    commands = generate_install_commands(recommends)
     
     for i, cmd in enumerate(commands, 1):
         print(f"{i}. {cmd}")
@@ -293,9 +403,9 @@ def print_install_commands() -> None:
     print("   python tools/dep.py --check")
 
 
-def show_install_info() -> int:
+def show_install_info(recommends: bool = False) -> int:
     """Show installation information and commands."""
-    print_install_commands()
+    print_install_commands(recommends)
     return 0
 
 
@@ -308,12 +418,16 @@ def main() -> int:
 Examples:
   python tools/dep.py --check      # Check dependencies (default)
   python tools/dep.py --install    # Show installation commands
+  python tools/dep.py --install --recommends  # ... including apt recommends
+  python tools/dep.py --force      # Re-check, ignoring cached results
   python tools/dep.py --help       # Show this help
         """
     )
     
     parser.add_argument("--check", action="store_true", help="Check dependencies and report status (default)")
     parser.add_argument("--install", action="store_true", help="Show commands to install dependencies (Ubuntu/Debian)")
+    parser.add_argument("--recommends", action="store_true", help="With --install, also install apt recommended packages")
+    parser.add_argument("--force", action="store_true", help="Ignore cached results and re-run all checks")
     
     args = parser.parse_args()
     
@@ -322,8 +436,19 @@ Examples:
         args.check = True
     
     if args.install:
-        return show_install_info()
+        return show_install_info(args.recommends)
     elif args.check:
+        cache_path = _cache_path()
+        checked_at = None if args.force else load_cached_success(cache_path)
+        if checked_at is not None:
+            # Environment and workaround status are cheap and not cached
+            print_report_header()
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(checked_at))
+            print("\n=== SUMMARY ===")
+            print(f"✅ ALL DEPENDENCIES AVAILABLE! (cached check from {when})")
+            print("🔁 Re-run all checks with: python tools/dep.py --check --force")
+            return 0
+
         failed_imports, success = check_dependencies()
         
         print(f"\n=== SUMMARY ===")
@@ -332,6 +457,7 @@ Examples:
             print_troubleshooting(failed_imports)
             return 1
         else:
+            store_success(cache_path)
             print("✅ ALL DEPENDENCIES AVAILABLE!")
             print("🚀 Ready to run tests!")
             return 0